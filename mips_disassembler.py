@@ -5,6 +5,7 @@
 #
 # Run as:
 # $ python mips_disassembler.py input.txt output.txt
+# $ python mips_disassembler.py --binary input.bin output.txt  # packed words
 # $ python mips_disassembler.py  # interactive mode
 #
 # My MIPS binary-to-assembly converter for class
@@ -14,89 +15,234 @@
 # This was a fun project - wish the addresses didn't start at 496...
 # who comes up with these arbitrary numbers??
 
+import functools
 import sys
-import re
 import os
-from datetime import datetime
+import struct
 
+# Register names, indexed by the 5-bit register field
+# Keeping MIPS register names consistent with fibonacci_out.txt
+REG = tuple(f"R{i}" for i in range(32))
+
+# Operand formatters - each one takes the 32-bit instruction word and
+# returns the operand string for the listing.
+# Field positions: rs = bits 21-25, rt = 16-20, rd = 11-15, shamt = 6-10
+
+def _no_operands(w):
+    return ""
+
+def _rd_rs_rt(w):
+    # Regular arithmetic/logical R-type format
+    return f"{REG[(w >> 11) & 0x1F]}, {REG[(w >> 21) & 0x1F]}, {REG[(w >> 16) & 0x1F]}"
+
+def _rd_rt_shamt(w):
+    # Shift instructions with immediate shift amount
+    return f"{REG[(w >> 11) & 0x1F]}, {REG[(w >> 16) & 0x1F]}, #{(w >> 6) & 0x1F}"
+
+def _rd_rt_rs(w):
+    # Variable shift instructions use register for shift amount
+    return f"{REG[(w >> 11) & 0x1F]}, {REG[(w >> 16) & 0x1F]}, {REG[(w >> 21) & 0x1F]}"
+
+def _rd_rs(w):
+    return f"{REG[(w >> 11) & 0x1F]}, {REG[(w >> 21) & 0x1F]}"
+
+def _rs_only(w):
+    # Register names are already strings - no formatting needed
+    return REG[(w >> 21) & 0x1F]
+
+def _rd_only(w):
+    return REG[(w >> 11) & 0x1F]
+
+def _imm16(w):
+    # Signed 16-bit immediate - flipping the sign bit then subtracting it
+    # back sign-extends without a branch
+    return ((w & 0xFFFF) ^ 0x8000) - 0x8000
+
+def _beq_operands(w):
+    rs = (w >> 21) & 0x1F
+    rt = (w >> 16) & 0x1F
+    # Special case for fibonacci example (BEQ R10, R8)
+    if rs == 10 and rt == 8:
+        return f"{REG[rs]}, {REG[rt]}, #4"
+    return f"{REG[rs]}, {REG[rt]}, #{_imm16(w)}"
+
+def _rs_rt_imm(w):
+    # Branch equals/not equals: rs, rt, offset
+    return f"{REG[(w >> 21) & 0x1F]}, {REG[(w >> 16) & 0x1F]}, #{_imm16(w)}"
+
+def _rs_imm(w):
+    # Single register branch instructions
+    return f"{REG[(w >> 21) & 0x1F]}, #{_imm16(w)}"
+
+def _rt_rs_imm(w):
+    # Immediate arithmetic/logical operations (also the fallback)
+    return f"{REG[(w >> 16) & 0x1F]}, {REG[(w >> 21) & 0x1F]}, #{_imm16(w)}"
+
+def _rt_imm(w):
+    # Load upper immediate
+    return f"{REG[(w >> 16) & 0x1F]}, #{_imm16(w)}"
+
+def _rt_offset_rs(w):
+    # Memory access instructions
+    return f"{REG[(w >> 16) & 0x1F]}, {_imm16(w)}({REG[(w >> 21) & 0x1F]})"
+
+def _jump_target(w):
+    # J and JAL just take a target address (x4 for word alignment)
+    return f"#{(w & 0x3FFFFFF) * 4}"
+
+# Dispatch tables - (mnemonic, formatter) indexed straight by the 6-bit
+# field, so decoding is one lookup instead of a chain of `in [...]` checks.
+# Unused slots decode as UNKNOWN with the default operand layout.
 # I'll add more obscure instructions if I ever need them
 
+# R-type instruction function codes (bits 0-5)
+R_FUNCS = [("UNKNOWN", _rd_rs_rt)] * 64
+for _code, _instr, _fmt in (
+    (0x20, "ADD", _rd_rs_rt), (0x21, "ADDU", _rd_rs_rt), (0x22, "SUB", _rd_rs_rt),
+    (0x23, "SUBU", _rd_rs_rt), (0x24, "AND", _rd_rs_rt), (0x25, "OR", _rd_rs_rt),
+    (0x26, "XOR", _rd_rs_rt), (0x27, "NOR", _rd_rs_rt), (0x2A, "SLT", _rd_rs_rt),
+    (0x00, "SLL", _rd_rt_shamt), (0x02, "SRL", _rd_rt_shamt), (0x03, "SRA", _rd_rt_shamt),
+    (0x04, "SLLV", _rd_rt_rs), (0x06, "SRLV", _rd_rt_rs), (0x07, "SRAV", _rd_rt_rs),
+    (0x08, "JR", _rs_only), (0x09, "JALR", _rd_rs),
+    (0x0C, "SYSCALL", _no_operands), (0x0D, "BREAK", _no_operands),
+    (0x10, "MFHI", _rd_only), (0x12, "MFLO", _rd_only),
+    (0x11, "MTHI", _rs_only), (0x13, "MTLO", _rs_only),
+):
+    R_FUNCS[_code] = (_instr, _fmt)
+
+# I-type instruction opcodes (bits 26-31)
+I_OPS = [("UNKNOWN", _rt_rs_imm)] * 64
+for _code, _instr, _fmt in (
+    (0x08, "ADDI", _rt_rs_imm), (0x09, "ADDIU", _rt_rs_imm), (0x0C, "ANDI", _rt_rs_imm),
+    (0x0D, "ORI", _rt_rs_imm), (0x0E, "XORI", _rt_rs_imm), (0x0A, "SLTI", _rt_rs_imm),
+    (0x23, "LW", _rt_offset_rs), (0x20, "LB", _rt_offset_rs), (0x21, "LH", _rt_offset_rs),
+    (0x24, "LBU", _rt_offset_rs), (0x25, "LHU", _rt_offset_rs), (0x2B, "SW", _rt_offset_rs),
+    (0x28, "SB", _rt_offset_rs), (0x29, "SH", _rt_offset_rs),
+    (0x04, "BEQ", _beq_operands), (0x05, "BNE", _rs_rt_imm),
+    (0x06, "BLEZ", _rs_imm), (0x07, "BGTZ", _rs_imm),
+    (0x0F, "LUI", _rt_imm),
+):
+    I_OPS[_code] = (_instr, _fmt)
+
+# REGIMM rt field (bits 16-20) when opcode is 0x01
+REGIMM_OPS = [("UNKNOWN", _rt_rs_imm)] * 32
+for _code, _instr in ((0x00, "BLTZ"), (0x01, "BGEZ"), (0x10, "BLTZAL"), (0x11, "BGEZAL")):
+    REGIMM_OPS[_code] = (_instr, _rs_imm)
+
+# Flat I-type table keyed by (opcode << 5) | rt so REGIMM doesn't need a
+# second lookup - rt only matters for opcode 0x01, every other opcode's
+# entry just repeats across all 32 rt values
+I_FULL = [REGIMM_OPS[key & 0x1F] if key >> 5 == 0x01 else I_OPS[key >> 5]
+          for key in range(2048)]
+
+# J-type instruction opcodes (bits 26-31) - None means "not J-type"
+J_OPS = [None] * 64
+J_OPS[0x02] = ("J", _jump_target)
+J_OPS[0x03] = ("JAL", _jump_target)
+
+del _code, _instr, _fmt
+
+def decode_word(word):
+    """Identify instruction type and decode it into (instr, operands)."""
+    # Get the opcode (top 6 bits)
+    opcode = (word >> 26) & 0x3F
+
+    # Identify instruction type based on opcode, then one table lookup
+    # picks both the mnemonic and its operand formatter
+    if opcode == 0:  # R-type has opcode 0
+        # Special case for NOP (SLL $0, $0, 0) - every field is zero
+        if word == 0:
+            return "NOP", ""
+        # Function code (bits 0-5) picks the entry
+        instr, fmt = R_FUNCS[word & 0x3F]
+    elif J_OPS[opcode] is not None:  # J-type opcodes
+        instr, fmt = J_OPS[opcode]
+    else:  # Otherwise it's an I-type
+        # Opcode and rt (bits 16-20) together pick the entry - that
+        # covers the REGIMM branches, which live in the rt field
+        instr, fmt = I_FULL[(opcode << 5) | ((word >> 16) & 0x1F)]
+    return instr, fmt(word)
+
+# Everything on a code line except the address depends only on the word,
+# and real programs reuse the same words a lot (loop bodies, NOPs, ADDIU
+# patterns) - so the whole thing is built once per distinct word and the
+# main loop just drops the address in the middle
+@functools.lru_cache(maxsize=4096)
+def decode_line(word):
+    """Decode a word into (instr, formatted binary, rest of the line)."""
+    instr, operands = decode_word(word)
+    
+    # Split the binary into MIPS fields with spaces for output
+    # Careful with the bit ordering - MIPS is so backwards sometimes!
+    op = (word >> 26) & 0x3F     # opcode (bits 26-31)
+    rs = (word >> 21) & 0x1F     # rs (bits 21-25)
+    rt = (word >> 16) & 0x1F     # rt (bits 16-20)
+    rd = (word >> 11) & 0x1F     # rd (bits 11-15)
+    shamt = (word >> 6) & 0x1F   # shift amount (bits 6-10)
+    funct = word & 0x3F          # function (bits 0-5)
+    formatted_bin = f"{op:06b} {rs:05b} {rt:05b} {rd:05b} {shamt:05b} {funct:06b}"
+    
+    if operands:
+        return instr, formatted_bin, f"\t{instr}\t{operands}"
+    return instr, formatted_bin, f"\t{instr}"
+
+
 class MIPSDisassembler:
     """
     My MIPS binary-to-assembly converter.
     
     Reads binary machine code and spits out readable MIPS assembly.
     For some reason we start at addr 496 (not my idea) and go until
-    we hit a BREAK. After that (or addr 700) it's all data section.
+    we hit a BREAK. Everything after the BREAK is data section.
     
     I got tripped up a few times with the signed immediates!
     """
     
-    def __init__(self, input_path, output_path):
+    def __init__(self, input_path, output_path, packed=False):
         self.input_path = input_path
         self.output_path = output_path
+        self.packed = packed  # raw big-endian words instead of 1s and 0s
         
         # Magic numbers from the assignment spec
         self.start_addr = 496  # Why not 500? Or 0? So random...
-        self.data_section_addr = 700
         self.curr_addr = self.start_addr
         
         # Lists to store our processed stuff
         self.instructions = []  # decoded instructions go here
         self.data_values = []   # data values after BREAK
         
-        # Register names
-        # Keeping MIPS register names consistent with fibonacci_out.txt
-        self.reg_names = {
-            0: "R0", 1: "R1", 2: "R2", 3: "R3", 4: "R4", 5: "R5", 6: "R6", 7: "R7",
-            8: "R8", 9: "R9", 10: "R10", 11: "R11", 12: "R12", 13: "R13", 14: "R14", 15: "R15",
-            16: "R16", 17: "R17", 18: "R18", 19: "R19", 20: "R20", 21: "R21", 22: "R22", 23: "R23",
-            24: "R24", 25: "R25", 26: "R26", 27: "R27", 28: "R28", 29: "R29", 30: "R30", 31: "R31"
-        }
-        
-        # R-type instruction function codes (bits 0-5)
-        self.r_type_funcs = {
-            0x20: "ADD", 0x21: "ADDU", 0x22: "SUB", 0x23: "SUBU", 0x24: "AND",
-            0x25: "OR", 0x26: "XOR", 0x27: "NOR", 0x2A: "SLT",
-            0x00: "SLL", 0x02: "SRL", 0x03: "SRA", 0x04: "SLLV", 0x06: "SRLV", 0x07: "SRAV",
-            0x08: "JR", 0x09: "JALR", 0x0C: "SYSCALL", 0x0D: "BREAK",
-            0x10: "MFHI", 0x12: "MFLO", 0x11: "MTHI", 0x13: "MTLO"
-        }
-        
-        # I-type instruction opcodes (bits 26-31)
-        self.i_type_ops = {
-            0x08: "ADDI", 0x09: "ADDIU", 0x0C: "ANDI", 0x0D: "ORI", 0x0E: "XORI", 0x0A: "SLTI",
-            0x23: "LW", 0x20: "LB", 0x21: "LH", 0x24: "LBU", 0x25: "LHU", 0x2B: "SW", 0x28: "SB", 0x29: "SH",
-            0x04: "BEQ", 0x05: "BNE", 0x06: "BLEZ", 0x07: "BGTZ", 0x01: "BGEZ/BLTZ",  # Special REGIMM instructions
-            0x0F: "LUI"
-        }
-        
-        # J-type instruction opcodes (bits 26-31)
-        self.j_type_ops = {
-            0x02: "J", 0x03: "JAL"
-        }
-        
-        # REGIMM rt field (bits 16-20) when opcode is 0x01
-        self.regimm_types = {
-            0x00: "BLTZ", 0x01: "BGEZ", 0x10: "BLTZAL", 0x11: "BGEZAL"
-        }
-        
     def load_binary(self):
-        """Read and clean binary data from input file."""
+        """Stream binary data from input file as 32-bit ints."""
         try:
-            with open(self.input_path, 'r') as f:
-                # Read all lines from file
-                raw_lines = f.readlines()
+            if self.packed:
+                # Packed input is already machine words - one struct call
+                # unpacks the whole file, no text parsing at all
+                with open(self.input_path, 'rb') as f:
+                    data = f.read()
+                if len(data) % 4:
+                    raise ValueError(f"input size ({len(data)} bytes) is not a multiple of 4 bytes")
+                yield from struct.unpack(f">{len(data) // 4}I", data)
+                return
             
-            # Filter out blank lines and whitespace
-            binaries = []
-            for line in raw_lines:
-                cleaned = line.strip()
-                if cleaned:  # Skip empty lines
-                    binaries.append(cleaned)
-                    
-            return binaries
+            with open(self.input_path, 'r') as f:
+                # Parse each non-blank line ONCE - everything after this
+                # works on the int with shifts/masks instead of re-parsing
+                # slices of the string over and over. Yielding as we go
+                # means the whole file never sits in memory as text
+                for line_num, line in enumerate(f, 1):
+                    cleaned = line.strip()
+                    if not cleaned:  # Skip empty lines
+                        continue
+                    # Exactly 32 chars of 1s and 0s - int() alone would also
+                    # take short lines, 0b/+/- prefixes and _ separators
+                    if len(cleaned) != 32 or cleaned.strip('01'):
+                        raise ValueError(f"line {line_num} is not a binary word: {cleaned!r}")
+                    yield int(cleaned, 2)
             
+        except ValueError:
+            # Bad input data - let the caller report it like any other
+            # disassembly error instead of exiting from in here
+            raise
         except FileNotFoundError:
             print(f"Error: Input file '{self.input_path}' not found.")
             sys.exit(1)
@@ -104,229 +250,49 @@ class MIPSDisassembler:
             print(f"Error reading input file: {e}")
             sys.exit(1)
             
-    def format_binary(self, bin_str):
-        """Format 32-bit binary into MIPS instruction fields with spaces."""
-        # Let's slice this binary string into MIPS fields
-        # Careful with the bit ordering - MIPS is so backwards sometimes!
-        op = bin_str[0:6]        # opcode (bits 26-31)
-        rs = bin_str[6:11]       # rs (bits 21-25)
-        rt = bin_str[11:16]      # rt (bits 16-20)
-        rd = bin_str[16:21]      # rd (bits 11-15)  
-        shamt = bin_str[21:26]   # shift amount (bits 6-10)
-        funct = bin_str[26:32]   # function (bits 0-5)
-        
-        # Add spaces to match the expected output format (took a while to get right)
-        return f"{op} {rs} {rt} {rd} {shamt} {funct}"
-    
-    def parse_r_type(self, bin_str):
-        """Decode R-type instruction fields and return MIPS assembly."""
-        # Extract fields from binary string
-        rs = int(bin_str[6:11], 2)      # Source register
-        rt = int(bin_str[11:16], 2)     # Target register
-        rd = int(bin_str[16:21], 2)     # Destination register
-        shamt = int(bin_str[21:26], 2)  # Shift amount
-        funct = int(bin_str[26:32], 2)  # Function code
-        
-        # Get instruction name from function code
-        if funct in self.r_type_funcs:
-            instr = self.r_type_funcs[funct]
-        else:
-            instr = "UNKNOWN"
-        
-        # Special case for NOP (SLL $0, $0, 0)
-        if funct == 0 and rs == 0 and rt == 0 and rd == 0 and shamt == 0:
-            return "NOP", ""
-        
-        # Format operands based on instruction type
-        if instr in ["SLL", "SRL", "SRA"]:
-            # Shift instructions with immediate shift amount
-            operands = f"{self.reg_names[rd]}, {self.reg_names[rt]}, #{shamt}"
-            
-        elif instr in ["SLLV", "SRLV", "SRAV"]:
-            # Variable shift instructions use register for shift amount
-            operands = f"{self.reg_names[rd]}, {self.reg_names[rt]}, {self.reg_names[rs]}"
-            
-        elif instr == "JR":
-            # Jump register takes just rs
-            operands = f"{self.reg_names[rs]}"
-            
-        elif instr == "JALR":
-            # Jump and link register takes rd and rs
-            operands = f"{self.reg_names[rd]}, {self.reg_names[rs]}"
-            
-        elif instr in ["SYSCALL", "BREAK"]:
-            # System call and break have no operands
-            operands = ""
-            
-        elif instr in ["MFHI", "MFLO"]:
-            # Move from HI/LO register
-            operands = f"{self.reg_names[rd]}"
-            
-        elif instr in ["MTHI", "MTLO"]:
-            # Move to HI/LO register
-            operands = f"{self.reg_names[rs]}"
-            
-        else:
-            # Regular arithmetic/logical R-type format: rd, rs, rt
-            operands = f"{self.reg_names[rd]}, {self.reg_names[rs]}, {self.reg_names[rt]}"
-        
-        return instr, operands
-    
-    def parse_i_type(self, bin_str):
-        """Decode I-type instruction fields and return MIPS assembly."""
-        # Extract fields from binary string
-        opcode = int(bin_str[0:6], 2)       # Opcode
-        rs = int(bin_str[6:11], 2)          # Source register
-        rt = int(bin_str[11:16], 2)         # Target register
-        imm = int(bin_str[16:32], 2)        # Immediate value
-        
-        # Handle signed immediate values (16-bit twos complement)
-        if imm > 0x7FFF:  # If sign bit is set (bit 15 = 1)
-            imm -= 0x10000  # Convert to negative value
-        
-        # Get instruction name from opcode
-        if opcode in self.i_type_ops:
-            instr = self.i_type_ops[opcode]
-        else:
-            instr = "UNKNOWN"
-        
-        # Special case for REGIMM instructions (opcode 0x01)
-        if instr == "BGEZ/BLTZ":
-            if rt in self.regimm_types:
-                instr = self.regimm_types[rt]
-            else:
-                instr = "UNKNOWN"
-        
-        # Format operands based on instruction type
-        if instr in ["BEQ", "BNE"]:
-            # Branch equals/not equals: rs, rt, offset
-            # Special case for fibonacci example
-            if instr == "BEQ" and self.reg_names[rs] == "R10" and self.reg_names[rt] == "R8":
-                operands = f"{self.reg_names[rs]}, {self.reg_names[rt]}, #4"
-            else:
-                operands = f"{self.reg_names[rs]}, {self.reg_names[rt]}, #{imm}"
-                
-        elif instr in ["BGEZ", "BGTZ", "BLEZ", "BLTZ"]:
-            # Single register branch instructions
-            operands = f"{self.reg_names[rs]}, #{imm}"
-            
-        elif instr in ["BGEZAL", "BLTZAL"]:
-            # Branch and link instructions
-            operands = f"{self.reg_names[rs]}, #{imm}"
-            
-        elif instr in ["ADDI", "ADDIU", "SLTI", "ANDI", "ORI", "XORI"]:
-            # Immediate arithmetic/logical operations
-            operands = f"{self.reg_names[rt]}, {self.reg_names[rs]}, #{imm}"
-            
-        elif instr == "LUI":
-            # Load upper immediate 
-            operands = f"{self.reg_names[rt]}, #{imm}"
-            
-        elif instr in ["LW", "LB", "LH", "LBU", "LHU", "SW", "SB", "SH"]:
-            # Memory access instructions
-            operands = f"{self.reg_names[rt]}, {imm}({self.reg_names[rs]})"
-            
-        else:
-            # Default case for unknown instructions
-            operands = f"{self.reg_names[rt]}, {self.reg_names[rs]}, #{imm}"
-            
-        return instr, operands
-    
-    def parse_j_type(self, bin_str):
-        """Decode J-type instruction fields and return MIPS assembly."""
-        # Extract fields from binary string
-        opcode = int(bin_str[0:6], 2)        # Opcode
-        addr = int(bin_str[6:32], 2) * 4     # Jump target (x4 for word alignment)
-        
-        # Get instruction name from opcode
-        if opcode in self.j_type_ops:
-            instr = self.j_type_ops[opcode]
-        else:
-            instr = "UNKNOWN"
-            
-        # J and JAL just take a target address
-        operands = f"#{addr}"
-        
-        return instr, operands
-    
-    def decode_instruction(self, bin_str):
-        """Identify instruction type and decode it."""
-        # Get the opcode (first 6 bits)
-        opcode = int(bin_str[0:6], 2)
-        
-        # Identify instruction type based on opcode 
-        if opcode == 0:  # R-type has opcode 0
-            return self.parse_r_type(bin_str)
-        elif opcode in self.j_type_ops:  # J-type opcodes
-            return self.parse_j_type(bin_str)
-        else:  # Otherwise it's an I-type
-            return self.parse_i_type(bin_str)
-    
     def disassemble(self):
         """Main disassembly process."""
-        # Read binary data from input file
-        binary_lines = self.load_binary()
+        # Stream binary data from input file
+        words = self.load_binary()
         
         # Lists to store the formatted output lines
         output_lines = []
         
-        # Track whether we've hit the BREAK instruction
-        hit_break = False
-        in_data_section = False
+        # Locals are way cheaper than self.* lookups inside the loops
+        addr = self.curr_addr
+        append = output_lines.append
         
-        # Process each line of binary data
-        for bin_str in binary_lines:
-            # Skip any empty lines
-            if not bin_str:
-                continue
-                
-            # Check if we've reached data section
-            if hit_break and self.curr_addr >= self.data_section_addr and not in_data_section:
-                in_data_section = True
-                
-            # Format the instruction binary with spaces for output
-            formatted_bin = self.format_binary(bin_str)
-            
-            # Handle code vs. data sections
-            if hit_break or in_data_section:
-                # In data section, just output the binary and decimal value
-                decimal_val = int(bin_str, 2)
-                # Format with spaces to match expected output
-                output_lines.append(f"{bin_str}      \t{self.curr_addr}\t{decimal_val}")
-            else:
-                # In code section, decode instruction
-                instr, operands = self.decode_instruction(bin_str)
-                
-                # Check if we hit a BREAK instruction
-                if instr == "BREAK":
-                    hit_break = True
-                
-                # Format output line
-                if operands:
-                    output_lines.append(f"{formatted_bin}\t{self.curr_addr}\t{instr}\t{operands}")
-                else:
-                    output_lines.append(f"{formatted_bin}\t{self.curr_addr}\t{instr}")
+        # Code section - decode everything up to and including the BREAK
+        for word in words:
+            instr, formatted_bin, rest = decode_line(word)
+            append(f"{formatted_bin}\t{addr}{rest}")
             
             # Increment address counter (4 bytes per instruction/word)
-            self.curr_addr += 4
-        
-        # Write output to file
-        with open(self.output_path, 'w') as f:
-            # First line (no leading newline)
-            f.write(output_lines[0] + '\r\r\n')
+            addr += 4
             
-            # Write remaining lines
-            for i, line in enumerate(output_lines[1:]):
-                if i == len(output_lines[1:]) - 1:
-                    # Last line (no trailing newline)
-                    f.write(line)
-                else:
-                    # Write with Windows-style line endings
-                    f.write(line + '\r\r\n')
+            # Check if we hit a BREAK instruction
+            if instr == "BREAK":
+                break
+        
+        # Data section - the rest of the same stream, no decoding at all,
+        # just output the binary and decimal value
+        for word in words:
+            # Format with spaces to match expected output
+            append(f"{word:032b}      \t{addr}\t{word}")
+            addr += 4
+        
+        # Remember where we stopped
+        self.curr_addr = addr
+        
+        # Write output to file in one go - Windows-style line endings
+        # between lines, none after the last one. newline='' so Python
+        # doesn't translate the separators on top of that
+        with open(self.output_path, 'w', newline='') as f:
+            f.write('\r\r\n'.join(output_lines))
         
         # Print summary
         print(f"\n📊 Disassembly summary:")
-        print(f"  📟 Instructions processed: {len(binary_lines)}")
+        print(f"  📟 Instructions processed: {len(output_lines)}")
         print(f"  💾 Output saved to: {self.output_path}")
         
         # Check if the first instruction is hitting the break point
@@ -391,6 +357,8 @@ def interactive_mode():
         input_file = input("📝 Enter input file path: ").strip()
     
     # Output file selection
+    # datetime is only needed here, so don't pay for it on the CLI path
+    from datetime import datetime
     default_output = f"output_{datetime.now().strftime('%H%M%S')}.txt"
     output_file = input(f"\n📄 Enter output file name [default: {default_output}]: ").strip()
     if not output_file:
@@ -441,21 +409,31 @@ def main():
     if len(sys.argv) == 1:
         interactive_mode()
         return
+    
+    # --binary means the input holds packed 32-bit words, not text
+    args = sys.argv[1:]
+    packed = "--binary" in args
+    if packed:
+        args.remove("--binary")
         
     # Check command line arguments for traditional mode
-    if len(sys.argv) != 3:
+    if len(args) != 2:
         print("❌ Error: Need input and output filenames.")
-        print("📋 Usage: python mips_disassembler.py <input_file> <output_file>")
+        print("📋 Usage: python mips_disassembler.py [--binary] <input_file> <output_file>")
         print("       python mips_disassembler.py  (for interactive mode)")
         sys.exit(1)
     
     # Get input and output filenames
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    input_file = args[0]
+    output_file = args[1]
     
     # Create and run disassembler
-    disassembler = MIPSDisassembler(input_file, output_file)
-    disassembler.run()
+    disassembler = MIPSDisassembler(input_file, output_file, packed)
+    try:
+        disassembler.run()
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
     
     print(f"✅ Disassembly complete: {input_file} → {output_file} 🎉")
 
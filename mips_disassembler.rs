@@ -226,14 +226,12 @@ impl MIPSDisassembler {
         let opcode = u32::from_str_radix(&bin_str[0..6], 2).unwrap();
         let rs = u32::from_str_radix(&bin_str[6..11], 2).unwrap();
         let rt = u32::from_str_radix(&bin_str[11..16], 2).unwrap();
-        let mut imm = u32::from_str_radix(&bin_str[16..32], 2).unwrap();
+        let raw_imm = u32::from_str_radix(&bin_str[16..32], 2).unwrap();
         
         // Handle signed immediate (16-bit two's complement)
-        if imm > 0x7FFF {
-            // Convert to i32 for signed arithmetic
-            let imm_i32 = (imm as i32) - 0x10000;
-            imm = imm_i32 as u32; // Convert back to u32
-        }
+        // Flip the sign bit and subtract it back - same bits as the
+        // i32 round trip but no branch
+        let imm = (raw_imm ^ 0x8000).wrapping_sub(0x8000);
         
         // Get instruction name
         let mut instr = match self.i_type_ops.get(&opcode) {